@@ -53,8 +53,7 @@ class Customizer(QWidget):
         """Handle changes to tree items (e.g., checkbox toggled)."""
         part_id = item.data(0, Qt.ItemDataRole.UserRole)
         is_visible = item.checkState(0) == Qt.CheckState.Checked
-        self.model_viewer.part_visibility[part_id] = is_visible
-        self.model_viewer.update()  # Trigger repaint in ModelViewer
+        self.model_viewer.set_part_visible(part_id, is_visible)  # Also triggers a repaint
 
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
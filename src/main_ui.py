@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QApplication, QToolButton, QSizePolicy, QDialog, QTextBrowser, QTextEdit
+from PyQt6.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QGridLayout, QApplication, QToolButton, QSizePolicy, QDialog, QTextBrowser, QTextEdit
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation
 from PyQt6.QtGui import QIcon, QCursor
 from src.llm.llm import LLM
@@ -7,9 +7,23 @@ from src.video_player import VideoPlayer
 from src.interfaces.customizer import Customizer
 from src.interfaces.settings import Settings
 from utils.pos import place_at, vw, vh
+from collections import deque
 import json
 import os
 
+# (config key, Settings attribute, value getter, default when Settings is unavailable)
+_SAVEABLE = (
+    ("allow_overflow", "allow_overflow", lambda w: w.isChecked(), False),
+    ("llm_prompt", "llm_prompt", lambda w: w.toPlainText(), "You are AINA, a helpful desktop pet assistant."),
+    ("llm_min_length", "min_length", lambda w: int(w.text()), 30),
+    ("llm_max_length", "max_length", lambda w: int(w.text()), 200),
+    ("llm_top_k", "top_k", lambda w: int(w.text()), 40),
+    ("llm_top_p", "top_p", lambda w: float(w.text()), 0.9),
+    ("llm_temperature", "temperature", lambda w: float(w.text()), 0.7),
+    ("ollama_model", "ollama_model", lambda w: w.toPlainText(), ""),
+    ("ollama_base_url", "ollama_base_url", lambda w: w.toPlainText(), "http://localhost:11434"),
+)
+
 class AINA(QWidget):
 
     progress_updated = pyqtSignal(int, str)
@@ -18,8 +32,10 @@ class AINA(QWidget):
         super().__init__()
         self.config_file = "config.json"
         self.video = None
+        self.video_loaded = False
         self.drag_area_size = 30
-        self.chat_history = []
+        self.chat_history = deque(maxlen=500)  # (user message, AINA response) pairs
+        self.pending_message = ""
         
         self.progress_updated.emit(20, "Initializing application...")
         self.settings = None
@@ -49,8 +65,9 @@ class AINA(QWidget):
 
     def init_ui(self):
         """Initialize the UI elements."""
-        outer_layout = QVBoxLayout()
-        main_layout = QHBoxLayout()
+        # Single grid instead of nested boxes:
+        # row 0 = drag area, rows 1-6 = chat (cols 0-1) | video (col 2) | buttons (col 3)
+        layout = QGridLayout()
     
         # Draggable area (button)
         self.drag_area = QPushButton(self)
@@ -71,10 +88,9 @@ class AINA(QWidget):
         self.drag_area.setCursor(QCursor(Qt.CursorShape.SizeAllCursor))
         self.drag_area.pressed.connect(self.start_drag)
         
-        outer_layout.addWidget(self.drag_area)
+        layout.addWidget(self.drag_area, 0, 0, 1, 4)
         
         # Chat system (Left)
-        chat_layout = QVBoxLayout()
         self.chat_bubble = QTextBrowser()
         self.chat_bubble.setStyleSheet("""
             background-color: #ff5733;
@@ -90,7 +106,6 @@ class AINA(QWidget):
         self.chat_bubble.setMaximumHeight(200)
         self.chat_bubble.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
         
-        chat_input_layout = QHBoxLayout()
         self.chat_input = QTextEdit()
         self.chat_input.setStyleSheet("""
             background-color: #e0e0e0;
@@ -103,8 +118,10 @@ class AINA(QWidget):
         self.chat_input.setFixedHeight(40)
         self.chat_input.keyPressEvent = self.handle_input_keypress
         
+        self.send_icon = QIcon("assets/icons/send.png")
+        self.loading_icon = QIcon("assets/icons/loading.png")
         self.send_button = QPushButton()
-        self.send_button.setIcon(QIcon("assets/icons/send.png"))
+        self.send_button.setIcon(self.send_icon)
         self.send_button.setFixedSize(30, 30)
         self.send_button.setStyleSheet("""
             QPushButton {
@@ -118,24 +135,17 @@ class AINA(QWidget):
         """)
         self.send_button.clicked.connect(self.send_message)
         
-        chat_input_layout.addWidget(self.chat_input)
-        chat_input_layout.addWidget(self.send_button)
-        
-        chat_layout.addWidget(self.chat_bubble)
-        chat_layout.addStretch()
-        chat_layout.addLayout(chat_input_layout)
-        
-        main_layout.addLayout(chat_layout, stretch=1)
+        layout.addWidget(self.chat_bubble, 1, 0, 5, 2, Qt.AlignmentFlag.AlignTop)
+        layout.addWidget(self.chat_input, 6, 0)
+        layout.addWidget(self.send_button, 6, 1)
         
         # Model viewer and buttons
-        content_layout = QHBoxLayout()
-        self.video = VideoPlayer("assets/animations/idle.mp4")
+        # The idle animation is loaded in showEvent so the media backend doesn't block the first paint
+        self.video = VideoPlayer()
         self.video.show()
-        content_layout.addWidget(self.video, stretch=2)
+        layout.addWidget(self.video, 1, 2, 6, 1)
         
         # Buttons (Right)
-        button_layout = QVBoxLayout()
-        
         # Exit Button
         self.exit_button = QToolButton()
         self.exit_button.setIcon(QIcon("assets/icons/exit.png"))
@@ -161,17 +171,17 @@ class AINA(QWidget):
         self.chatlogs_button.clicked.connect(self.open_chatlogs)
 
         # Add buttons to layout
-        button_layout.addWidget(self.new_chat_button)
-        button_layout.addWidget(self.chatlogs_button)
-        button_layout.addWidget(self.setting_button)
-        button_layout.addWidget(self.exit_button)
-        button_layout.addStretch()
+        layout.addWidget(self.new_chat_button, 1, 3)
+        layout.addWidget(self.chatlogs_button, 2, 3)
+        layout.addWidget(self.setting_button, 3, 3)
+        layout.addWidget(self.exit_button, 4, 3)
         
-        content_layout.addLayout(button_layout)
-        main_layout.addLayout(content_layout)
-        outer_layout.addLayout(main_layout)
+        # Row 5 absorbs the vertical slack (keeps buttons at the top, input at the bottom)
+        layout.setRowStretch(5, 1)
+        # Chat column gets the stretch, like the old stretch=1 on the chat layout
+        layout.setColumnStretch(0, 1)
     
-        self.setLayout(outer_layout)
+        self.setLayout(layout)
         self.setMinimumSize(300, 200 + self.drag_area_size)
 
     def load_config(self):
@@ -209,17 +219,11 @@ class AINA(QWidget):
         """Save settings to config file."""
         self.config["width"] = self.width()
         self.config["height"] = self.height()
-        self.config["allow_overflow"] = self.settings.allow_overflow.isChecked() if self.settings and hasattr(self.settings, 'allow_overflow') else False
         self.config["pos_x"] = self.x()
         self.config["pos_y"] = self.y()
-        self.config["llm_prompt"] = self.settings.llm_prompt.toPlainText() if self.settings and hasattr(self.settings, 'llm_prompt') else "You are AINA, a helpful desktop pet assistant."
-        self.config["llm_min_length"] = int(self.settings.min_length.text()) if self.settings and hasattr(self.settings, 'min_length') else 30
-        self.config["llm_max_length"] = int(self.settings.max_length.text()) if self.settings and hasattr(self.settings, 'max_length') else 200
-        self.config["llm_top_k"] = int(self.settings.top_k.text()) if self.settings and hasattr(self.settings, 'top_k') else 40
-        self.config["llm_top_p"] = float(self.settings.top_p.text()) if self.settings and hasattr(self.settings, 'top_p') else 0.9
-        self.config["llm_temperature"] = float(self.settings.temperature.text()) if self.settings and hasattr(self.settings, 'temperature') else 0.7
-        self.config["ollama_model"] = self.settings.ollama_model.toPlainText() if self.settings and hasattr(self.settings, 'ollama_model') else ""
-        self.config["ollama_base_url"] = self.settings.ollama_base_url.toPlainText() if self.settings and hasattr(self.settings, 'ollama_base_url') else "http://localhost:11434"
+        for key, attr, getter, default in _SAVEABLE:
+            widget = getattr(self.settings, attr, None)
+            self.config[key] = getter(widget) if widget is not None else default
         
         try:
             with open(self.config_file, 'w') as f:
@@ -231,14 +235,23 @@ class AINA(QWidget):
         """Send message from input to LLM"""
         message = self.chat_input.toPlainText().strip()
         if message:
-            self.chat_input.setEnabled(False)
-            self.send_button.setEnabled(False)
-            self.send_button.setIcon(QIcon("assets/icons/loading.png"))
+            self.pending_message = message
+            self.set_input_busy(True)
             self.llm.process_message(message)
 
+    def set_input_busy(self, busy):
+        """Toggle the chat input row between idle and waiting, repainting once."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.chat_input.setEnabled(not busy)
+            self.send_button.setEnabled(not busy)
+            self.send_button.setIcon(self.loading_icon if busy else self.send_icon)
+        finally:
+            self.setUpdatesEnabled(True)
+
     def process_message_response(self, response):
         """Handle LLM response from worker thread"""
-        self.chat_history.append(f"User: {self.chat_input.toPlainText().strip()}\nAINA: {response}")
+        self.chat_history.append((self.pending_message, response))
         self.current_response = response
         self.response_index = 0
         self.chat_input.clear()
@@ -250,10 +263,8 @@ class AINA(QWidget):
         self.animation_timer.timeout.connect(self.animate_text)
         self.animation_timer.start(self.config.get("typing_speed", 10))  # ms per character
         
-        self.chat_input.setEnabled(True)
-        self.send_button.setEnabled(True)
+        self.set_input_busy(False)
         self.new_chat_button.setEnabled(True)
-        self.send_button.setIcon(QIcon("assets/icons/send.png"))
 
     def animate_text(self):
         """Display text letter by letter"""
@@ -280,6 +291,13 @@ class AINA(QWidget):
         self.current_response = ""
         self.response_index = 0
 
+    def showEvent(self, event):
+        """Load the idle animation on the first event-loop pass after the window is shown."""
+        super().showEvent(event)
+        if not self.video_loaded:
+            self.video_loaded = True
+            QTimer.singleShot(0, lambda: self.video.set_video("assets/animations/idle.mp4"))
+
     def quit(self):
         QApplication.quit()
 
@@ -297,11 +315,11 @@ class AINA(QWidget):
 
     def open_settings(self):
         """Open AINA settings interface."""
-        if self.settings is None or not self.settings.isVisible():
+        if self.settings is None:
             self.settings = Settings(self)
-            self.settings.show()
-        else:
-            self.settings.raise_()
+        self.settings.show()
+        self.settings.raise_()
+        self.settings.activateWindow()
             
     def open_chatlogs(self):
         """Open AINA chatlogs interface."""
@@ -318,7 +336,7 @@ class AINA(QWidget):
             padding: 5px;
             color: black;
         """)
-        log_display.setText("\n\n".join(self.chat_history))
+        log_display.setText("\n\n".join(f"User: {user}\nAINA: {aina}" for user, aina in self.chat_history))
 
         close_button = QPushButton("Close")
         close_button.setStyleSheet("""
@@ -339,10 +357,8 @@ class AINA(QWidget):
             self.llm.thread.wait()  # Ensure thread terminates
         self.llm.new_chat()
         self.chat_history.clear()
-        self.chat_input.setEnabled(True)
-        self.send_button.setEnabled(True)
+        self.set_input_busy(False)
         self.video.set_video("assets/animations/idle.mp4")
-        self.send_button.setIcon(QIcon("assets/icons/send.png"))
 
     def start_drag(self):
         """Initiate dragging when the drag_area button is pressed."""
@@ -1,30 +1,216 @@
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QCursor
+from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtGui import QCursor, QSurfaceFormat
 from OpenGL.GL import *
-from OpenGL.arrays import vbo
+from OpenGL.GL.EXT.texture_compression_s3tc import GL_COMPRESSED_RGBA_S3TC_DXT5_EXT
+from OpenGL.GL.EXT.texture_filter_anisotropic import GL_TEXTURE_MAX_ANISOTROPY_EXT, GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT
+from OpenGL.GL.ARB.bindless_texture import (
+    glGetTextureHandleARB, glMakeTextureHandleResidentARB, glMakeTextureHandleNonResidentARB, glUniformHandleui64ARB
+)
+from OpenGL.GL import shaders
 import numpy as np
 from pygltflib import GLTF2
 from PIL import Image
 import os
 import urllib.parse
 import io
-import struct
+import ctypes
+import mmap
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Divisors for glTF normalized integer components (BYTE, UNSIGNED_BYTE, SHORT, UNSIGNED_SHORT)
+NORMALIZED_DIVISORS = {5120: 127.0, 5121: 255.0, 5122: 32767.0, 5123: 65535.0}
+
+# Interleaved per-vertex layout shared by every part's VBO (24-byte stride);
+# positions are float16 after fitting the model to the view, normals are SNORM16,
+# and each is padded to 8 bytes to keep the UVs 4-byte aligned
+VERTEX_DTYPE = np.dtype([
+    ('position', np.float16, 3),
+    ('position_pad', np.float16),
+    ('normal', np.int16, 3),
+    ('normal_pad', np.int16),
+    ('uv', np.float32, 2)
+])
+
+# Oldest context the renderer runs on: VAOs, indexed extension queries, half-float attributes
+# and glMultiDrawElementsBaseVertex are all core from OpenGL 3.2. The widget requests it as a
+# compatibility profile, since the GLSL 120 shaders are not accepted by a core profile
+MIN_GL_VERSION = (3, 2)
+
+# Upper bound for anisotropic filtering, which lets the mip chain do the minification of oblique textures
+MAX_TEXTURE_ANISOTROPY = 16.0
+
+# Textures at least this large (in both dimensions) are stored compressed when the driver supports S3TC
+COMPRESSED_TEXTURE_MIN_SIZE = 256
+
+# Client pixel layout for texture uploads: BGRA bytes hit the drivers' unswizzled DMA path
+TEXTURE_UPLOAD_FORMAT = (GL_BGRA, GL_UNSIGNED_INT_8_8_8_8_REV)
+
+# Pixel unpack buffers cycled through for texture uploads, so up to this many uploads can overlap
+PIXEL_BUFFER_COUNT = 3
+
+# Interaction repaints are coalesced to at most one per display frame (~60 Hz)
+REPAINT_INTERVAL_MS = 16
+
+# Per-part/per-texture load logging and visibility dumps; errors and load summaries are always printed
+VERBOSE = False
+
+# Point cloud mode draws every Nth vertex of each part in Morton (Z-curve) order
+POINT_CLOUD_STRIDE = 16
+
+# Generic vertex attribute locations bound before the shader program is linked
+POSITION_ATTRIB, NORMAL_ATTRIB, UV_ATTRIB = 0, 1, 2
+
+VERTEX_SHADER = """
+#version 120
+attribute vec3 aPosition;
+attribute vec3 aNormal;
+attribute vec2 aUV;
+uniform mat4 uMVP;
+varying vec2 vUV;
+void main() {
+    vUV = aUV;
+    gl_Position = uMVP * vec4(aPosition, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+uniform sampler2D uTexture;
+uniform bool uUseTexture;
+varying vec2 vUV;
+void main() {
+    gl_FragColor = uUseTexture ? texture2D(uTexture, vUV) : vec4(1.0);
+}
+"""
+
+# Used instead of FRAGMENT_SHADER when GL_ARB_bindless_texture is available:
+# uTexture is set from a resident texture handle rather than a bound texture unit
+BINDLESS_FRAGMENT_SHADER = """
+#version 400 compatibility
+#extension GL_ARB_bindless_texture : require
+layout(bindless_sampler) uniform sampler2D uTexture;
+uniform bool uUseTexture;
+varying vec2 vUV;
+void main() {
+    gl_FragColor = uUseTexture ? texture2D(uTexture, vUV) : vec4(1.0);
+}
+"""
+
+def frustum_matrix(left, right, bottom, top, near, far):
+    """Row-major equivalent of glFrustum."""
+    return np.array([
+        [2 * near / (right - left), 0, (right + left) / (right - left), 0],
+        [0, 2 * near / (top - bottom), (top + bottom) / (top - bottom), 0],
+        [0, 0, -(far + near) / (far - near), -2 * far * near / (far - near)],
+        [0, 0, -1, 0]
+    ], dtype=np.float32)
+
+def translation_matrix(x, y, z):
+    """Row-major equivalent of glTranslatef."""
+    matrix = np.identity(4, dtype=np.float32)
+    matrix[:3, 3] = (x, y, z)
+    return matrix
+
+def rotation_matrix(angle, axis):
+    """Row-major rotation by angle degrees around the x (0) or y (1) axis, as glRotatef."""
+    c, s = np.cos(np.radians(angle)), np.sin(np.radians(angle))
+    matrix = np.identity(4, dtype=np.float32)
+    if axis == 0:
+        matrix[1:3, 1:3] = ((c, -s), (s, c))
+    else:
+        matrix[0, 0], matrix[0, 2], matrix[2, 0], matrix[2, 2] = c, s, -s, c
+    return matrix
+
+def decode_texture(source, max_size, flip=False, mipmaps=False):
+    """Decode an image file or file-like object into upload-ready BGRA bytes, returning (levels, width, height).
+
+    levels holds the base image, followed by its full mipmap chain down to 1x1 when mipmaps is set.
+    Safe to call from worker threads: decoding, conversion, mipmapping and packing are all done here
+    so the GL thread only has to upload. Images larger than max_size are downscaled to fit.
+    """
+    image = Image.open(source)
+    # Upload at full resolution and let glGenerateMipmap handle minification;
+    # only downscale images the driver cannot store
+    oversized = image.width > max_size or image.height > max_size
+    if oversized:
+        # Only the header has been read so far: let JPEG decode straight at a reduced DCT scale
+        # (no smaller than max_size) instead of decoding every pixel and discarding most of them
+        image.draft('RGB', (max_size, max_size))
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    if oversized:
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    # Encoding the rows bottom-up (orientation -1) flips the image within the single tobytes pass
+    orientation = -1 if flip else 1
+    levels = [image.tobytes("raw", "BGRA", 0, orientation)]
+    if mipmaps:
+        # Box-filter each level from the previous one, with GL's floor(size / 2) level sizes
+        level = image
+        while level.width > 1 or level.height > 1:
+            level = level.resize((max(1, level.width // 2), max(1, level.height // 2)), Image.Resampling.BOX)
+            levels.append(level.tobytes("raw", "BGRA", 0, orientation))
+    return levels, image.width, image.height
+
+def morton_order(positions):
+    """Return the indices that sort (N, 3) positions along a 30-bit Morton (Z-order) curve."""
+    low = positions.min(axis=0)
+    extent = np.maximum(positions.max(axis=0) - low, np.float32(1e-12))
+    cells = ((positions - low) / extent * 1023).astype(np.uint32)
+    # Spread the low 10 bits of each axis so they can be interleaved as x, y, z
+    cells &= 0x3FF
+    cells = (cells | (cells << 16)) & 0x030000FF
+    cells = (cells | (cells << 8)) & 0x0300F00F
+    cells = (cells | (cells << 4)) & 0x030C30C3
+    cells = (cells | (cells << 2)) & 0x09249249
+    codes = cells[:, 0] | (cells[:, 1] << 1) | (cells[:, 2] << 2)
+    return np.argsort(codes, kind='stable')
+
+def frustum_visible(clip_matrix, mins, maxs):
+    """Return which (N, 3) AABBs intersect the view frustum of a row-major clip matrix.
+
+    Planes are extracted Gribb-Hartmann style; a box is culled when its most positive
+    corner lies behind any plane.
+    """
+    rows = clip_matrix
+    planes = np.array([
+        rows[3] + rows[0], rows[3] - rows[0],
+        rows[3] + rows[1], rows[3] - rows[1],
+        rows[3] + rows[2], rows[3] - rows[2]
+    ])
+    normals = planes[:, :3]
+    corners = np.where(normals >= 0, maxs[:, None, :], mins[:, None, :])
+    distances = np.einsum('npk,pk->np', corners, normals) + planes[:, 3]
+    return ~(distances < 0).any(axis=1)
 
 class ModelViewer(QOpenGLWidget):
     def __init__(self, model_path, part_visibility=None):
         super().__init__()
+        # Must be set before the widget is shown; the platform default may be a 2.1 or 1.1 context
+        surface_format = QSurfaceFormat(self.format())
+        surface_format.setVersion(*MIN_GL_VERSION)
+        surface_format.setProfile(QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile)
+        self.setFormat(surface_format)
         self.model_path = model_path
         self.meshes = []  # List to store multiple meshes or parts
         self.texture_ids = {}  # Dictionary to store texture IDs
         self.material_map = {}  # Maps mesh parts to their materials/textures
+        self.material_texture_ids = {}  # Material index -> OpenGL texture ID, resolved once at load
+        self.part_texture_gl_id = {}  # Part -> OpenGL texture ID it is drawn with
         self.rotation_x = 30
         self.rotation_y = 30
         self.translate_x = 0.0
         self.translate_y = 0.0
-        self.last_pos = None
+        self.last_pos = None  # (x, y) of the previous mouse event, as plain floats
         self.zoom = -4.0
         
+        # Single-shot timer that coalesces repaints requested by mouse interaction
+        self.repaint_timer = QTimer(self)
+        self.repaint_timer.setSingleShot(True)
+        self.repaint_timer.setInterval(REPAINT_INTERVAL_MS)
+        self.repaint_timer.timeout.connect(self.update)
+        
         # Animation properties
         self.animations = []
         self.current_animation = None
@@ -35,12 +221,58 @@ class ModelViewer(QOpenGLWidget):
         self.part_visibility = {int(k): v for k, v in (part_visibility or {}).items()}
         self.part_names = {}
         
-        # VBO objects
-        self.vertex_vbos = {}  # Dictionary to store VBOs for different parts
-        self.uv_vbos = {}
-        self.normal_vbos = {}
-        self.index_buffers = {}
+        # Mesh buffers: every part lives in one shared vertex buffer and one shared index buffer
+        self.vertex_buffer = None  # Interleaved position/normal/UV GL buffer
+        self.index_buffer = None  # GL element buffer with every part's triangle and point indices
+        self.mesh_vao = None  # Single VAO over the shared buffers; parts are drawn with a base vertex
+        self.buffer_pool = {}  # Buffer target -> GL buffer kept from the previous model, see recycle_buffer
+        self.buffer_capacities = {}  # GL buffer -> allocated size in bytes
+        self.vertex_data = {}  # CPU copy of each part's interleaved vertices, kept only while loading
+        self.position_data = {}  # Each part's float32 positions in model space, kept only while loading
+        self.index_data = {}  # Each part's uint16/uint32 indices, kept only while loading
+        self.point_cloud_data = {}  # Each part's decimated point indices, kept only while loading
+        self.accessor_cache = {}  # (accessor index, components) -> decoded array, kept only while loading
+        self.index_types = {}  # GL index type (GL_UNSIGNED_SHORT/GL_UNSIGNED_INT) per indexed part
         self.num_faces = {}
+        self.base_vertices = {}  # Part -> index of its first vertex in the shared vertex buffer
+        self.index_offsets = {}  # Part -> byte offset of its triangle indices in the shared index buffer
+        self.point_cloud_offsets = {}  # Part -> byte offset of its point indices in the shared index buffer
+        self.point_cloud_counts = {}
+        self.point_cloud_mode = False
+        self.wireframe = False  # Wireframe mode, tracked here instead of querying GL
+        self.polygon_mode_dirty = False  # Set when wireframe changed and paintGL has not applied it yet
+        self.part_bounds = {}  # Part -> (min, max) of its positions in model space
+        self.part_centroids = {}  # Part -> mean of its positions in model space, for picking/bounds display
+        self.draw_bounds = (np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32))  # Bounds aligned with draw_order
+        self.draw_order = []  # Precomputed draw calls for visible parts, see build_draw_order
+        self.draw_batches = []  # (start, end, texture, index type) runs of draw_order drawn with one multi-draw
+        self.draw_counts = np.zeros(0, dtype=np.int32)  # Per-entry arrays of draw_order for the multi-draw calls
+        self.draw_index_offsets = np.zeros(0, dtype=np.intp)
+        self.draw_base_vertices = np.zeros(0, dtype=np.int32)
+        self.draw_order_dirty = True
+        self.bound_texture = None  # Texture bound during the current paintGL
+        self.texture_enabled = None  # uUseTexture value during the current paintGL
+        self.shader_program = None  # Compiled in initializeGL
+        self.mvp_location = -1
+        self.model_scale = 1.0  # Fit-to-view scale baked into the uploaded positions, see scale_model
+        self.model_offset = np.zeros(3, dtype=np.float32)  # Scaled centroid subtracted after scaling
+        self.use_texture_location = -1
+        self.texture_location = -1
+        self.bindless_textures = False  # Whether uTexture is set from bindless handles, see initializeGL
+        self.texture_handles = {}  # GL texture id -> resident bindless handle, created on first draw
+        self.projection_matrix = frustum_matrix(-1.0, 1.0, -1.0, 1.0, 2.0, 100.0)
+        self.mvp = np.identity(4, dtype=np.float32)  # Cached projection @ model-view, see update_view_matrices
+        self.cull_matrix = np.identity(4, dtype=np.float32)  # mvp with the fit-to-view transform, for culling
+        self.view_dirty = True  # Set whenever the camera, projection or model fit changes
+        self.buffer_mmap = None  # Memory-mapped external .bin while a GLTF model is loading
+        self.max_texture_size = 1024  # Replaced by the driver limit in initializeGL
+        self.texture_anisotropy = 1.0  # Anisotropic filtering level for new textures, set in initializeGL
+        self.gl_extensions = set()  # Filled in initializeGL
+        self.has_mipmap = False  # Whether glGenerateMipmap is available, checked once in initializeGL
+        self.texture_storage = {}  # Texture ID -> (width, height) of its allocated storage
+        self.pixel_buffers = []  # Ring of pixel unpack buffers, created on the first texture upload
+        self.pixel_buffer_index = 0
+        self.pixel_buffer_sizes = {}  # Pixel unpack buffer -> allocated size in bytes
 
     def initializeGL(self):
         """Initialize OpenGL settings."""
@@ -49,97 +281,345 @@ class ModelViewer(QOpenGLWidget):
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glEnable(GL_TEXTURE_2D)
         glClearColor(0, 0, 0, 0)  # Transparent background
-        print(f"Before load_model in initializeGL, part_visibility: {self.part_visibility}")
+        glPointSize(3.0)  # Size of the points drawn in point cloud mode
+        version = self.context().format().version()
+        if version < MIN_GL_VERSION:
+            # Leave shader_program unset so paintGL only clears instead of failing on missing entry points
+            print(f"OpenGL {version[0]}.{version[1]} is too old for the model viewer "
+                  f"(needs {MIN_GL_VERSION[0]}.{MIN_GL_VERSION[1]}), the model will not be drawn")
+            return
+        self.max_texture_size = int(glGetIntegerv(GL_MAX_TEXTURE_SIZE))
+        self.gl_extensions = {
+            glGetStringi(GL_EXTENSIONS, i).decode()
+            for i in range(int(glGetIntegerv(GL_NUM_EXTENSIONS)))
+        }
+        if self.gl_extensions & {'GL_EXT_texture_filter_anisotropic', 'GL_ARB_texture_filter_anisotropic'}:
+            self.texture_anisotropy = min(MAX_TEXTURE_ANISOTROPY, float(glGetFloatv(GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT)))
+        self.bindless_textures = 'GL_ARB_bindless_texture' in self.gl_extensions
+        self.create_shader_program()
+        if self.bindless_textures and not self.shader_program:
+            print("Bindless texture shader unavailable, falling back to bound textures")
+            self.bindless_textures = False
+            self.create_shader_program()
+        self.has_mipmap = bool(glGenerateMipmap)
+        if VERBOSE:
+            print(f"Before load_model in initializeGL, part_visibility: {self.part_visibility}")
         self.load_model(self.model_path)
-        print(f"After load_model in initializeGL, part_visibility: {self.part_visibility}")
+        if VERBOSE:
+            print(f"After load_model in initializeGL, part_visibility: {self.part_visibility}")
 
     def resizeGL(self, w, h):
         """Handle window resizing."""
         glViewport(0, 0, w, h)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
         aspect = w / h if h > 0 else 1
-        glFrustum(-aspect, aspect, -1.0, 1.0, 2.0, 100.0)
-        glMatrixMode(GL_MODELVIEW)
+        self.projection_matrix = frustum_matrix(-aspect, aspect, -1.0, 1.0, 2.0, 100.0)
+        self.view_dirty = True
 
     def paintGL(self):
         """Render the 3D model using optimized rendering."""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-        
-        # Zoom and Move Camera
-        glTranslatef(self.translate_x, self.translate_y, self.zoom)
-        
-        # Apply rotation
-        glRotatef(self.rotation_x, 1, 0, 0)
-        glRotatef(self.rotation_y, 0, 1, 0)
+        if self.shader_program is None:
+            return
+        glUseProgram(self.shader_program)
         
         # Apply animations if active
         if self.is_animating and self.current_animation:
             self.apply_animation()
         
-        # Render each mesh part
-        if self.meshes:
-            for part_id in range(len(self.meshes)):
-                # Skip if part is hidden
-                if not self.part_visibility.get(part_id, True):
-                    continue
-                
-                # Check if part has VBOs
-                if part_id in self.vertex_vbos:
-                    self.render_part_with_vbos(part_id)
-
-    def render_part_with_vbos(self, part_id):
-        """Render a specific part using VBOs with texture mapping."""
-        # Get the texture ID for this part
-        texture_id = self.material_map.get(part_id, None)
-        
-        # Bind texture if available
-        if texture_id is not None and texture_id in self.texture_ids:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.texture_ids[texture_id])
+        if self.polygon_mode_dirty:
+            self.apply_polygon_mode()
+        
+        # Matrices are only rebuilt after the camera or projection changed
+        if self.view_dirty:
+            self.update_view_matrices()
+        # Upload the combined matrix once per frame (NumPy is row-major, hence the transpose)
+        glUniformMatrix4fv(self.mvp_location, 1, GL_TRUE, self.mvp)
+        
+        # Render visible parts in material order so each texture is bound once per frame
+        if self.draw_order_dirty:
+            self.build_draw_order()
+        
+        # Skip parts whose bounds are entirely off-screen
+        in_view = frustum_visible(self.cull_matrix, *self.draw_bounds)
+        
+        # Culled parts keep their slot with a zero count, which the multi-draw skips
+        counts = np.where(in_view, self.draw_counts, 0).astype(np.int32)
+        
+        self.bound_texture = None
+        self.texture_enabled = None
+        primitive = GL_POINTS if self.point_cloud_mode else GL_TRIANGLES
+        index_offsets = self.draw_index_offsets
+        base_vertices = self.draw_base_vertices
+        bind_part_texture = self.bind_part_texture
+        glBindVertexArray(self.mesh_vao or 0)
+        for start, end, gl_texture, index_type in self.draw_batches:
+            if not counts[start:end].any():
+                continue
+            bind_part_texture(gl_texture)
+            if index_type is not None:
+                glMultiDrawElementsBaseVertex(
+                    primitive, counts[start:end], index_type,
+                    index_offsets[start:end], end - start, base_vertices[start:end]
+                )
+            else:
+                # Fallback to drawing arrays if index buffer isn't available
+                glMultiDrawArrays(primitive, base_vertices[start:end], counts[start:end], end - start)
+        glBindVertexArray(0)
+        glUseProgram(0)
+
+    def apply_polygon_mode(self):
+        """Set the GL polygon state for the current wireframe flag."""
+        if self.wireframe:
+            glDisable(GL_POLYGON_OFFSET_FILL)
+            glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
         else:
-            glDisable(GL_TEXTURE_2D)
-
-        # Enable arrays
-        glEnableClientState(GL_VERTEX_ARRAY)
-        if part_id in self.normal_vbos and self.normal_vbos[part_id] is not None:
-            glEnableClientState(GL_NORMAL_ARRAY)
-        if part_id in self.uv_vbos and self.uv_vbos[part_id] is not None and texture_id is not None:
-            glEnableClientState(GL_TEXTURE_COORD_ARRAY)
-
-        # Bind and set up arrays
-        if part_id in self.vertex_vbos and self.vertex_vbos[part_id] is not None:
-            self.vertex_vbos[part_id].bind()
-            glVertexPointer(3, GL_FLOAT, 0, None)
-
-        if part_id in self.normal_vbos and self.normal_vbos[part_id] is not None:
-            self.normal_vbos[part_id].bind()
-            glNormalPointer(GL_FLOAT, 0, None)
-
-        if part_id in self.uv_vbos and self.uv_vbos[part_id] is not None and texture_id is not None:
-            self.uv_vbos[part_id].bind()
-            glTexCoordPointer(2, GL_FLOAT, 0, None)
-
-        # Draw the triangles
-        if part_id in self.index_buffers and self.index_buffers[part_id] is not None:
-            glDrawElements(GL_TRIANGLES, self.num_faces.get(part_id, 0) * 3, GL_UNSIGNED_INT, self.index_buffers[part_id])
+            glEnable(GL_POLYGON_OFFSET_FILL)
+            glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+        self.polygon_mode_dirty = False
+
+    def update_view_matrices(self):
+        """Rebuild the cached MVP and culling matrices from the camera state."""
+        # Zoom and move camera, then apply rotation
+        model_view = (
+            translation_matrix(self.translate_x, self.translate_y, self.zoom)
+            @ rotation_matrix(self.rotation_x, 0)
+            @ rotation_matrix(self.rotation_y, 1)
+        )
+        self.mvp = self.projection_matrix @ model_view
+        # Part bounds are in model space, so fold in the fit-to-view scale/offset baked into the positions
+        fit = np.diag([self.model_scale, self.model_scale, self.model_scale, 1.0]).astype(np.float32)
+        fit[:3, 3] = -self.model_offset
+        self.cull_matrix = self.mvp @ fit
+        self.view_dirty = False
+
+    def create_shader_program(self):
+        """Compile and link the shader used for every part."""
+        try:
+            vertex_shader = shaders.compileShader(VERTEX_SHADER, GL_VERTEX_SHADER)
+            fragment_source = BINDLESS_FRAGMENT_SHADER if self.bindless_textures else FRAGMENT_SHADER
+            fragment_shader = shaders.compileShader(fragment_source, GL_FRAGMENT_SHADER)
+            program = glCreateProgram()
+            glAttachShader(program, vertex_shader)
+            glAttachShader(program, fragment_shader)
+            glBindAttribLocation(program, POSITION_ATTRIB, "aPosition")
+            glBindAttribLocation(program, NORMAL_ATTRIB, "aNormal")
+            glBindAttribLocation(program, UV_ATTRIB, "aUV")
+            glLinkProgram(program)
+            glDeleteShader(vertex_shader)
+            glDeleteShader(fragment_shader)
+            if glGetProgramiv(program, GL_LINK_STATUS) != GL_TRUE:
+                print(f"Error linking shader program: {glGetProgramInfoLog(program)}")
+                glDeleteProgram(program)
+                return
+
+            self.shader_program = program
+            self.mvp_location = glGetUniformLocation(program, "uMVP")
+            self.use_texture_location = glGetUniformLocation(program, "uUseTexture")
+            self.texture_location = glGetUniformLocation(program, "uTexture")
+            if not self.bindless_textures:
+                glUseProgram(program)
+                glUniform1i(self.texture_location, 0)
+                glUseProgram(0)
+        except Exception as e:
+            import traceback
+            print(f"Error creating shader program: {e}")
+            print(traceback.format_exc())
+
+    def bind_part_texture(self, gl_texture):
+        """Bind the texture shared by a draw batch, or disable texturing if there is none.
+
+        GL calls are skipped when the requested state matches what is already set this frame.
+        """
+        enabled = gl_texture is not None
+        if enabled != self.texture_enabled:
+            glUniform1i(self.use_texture_location, enabled)
+            self.texture_enabled = enabled
+        if enabled and gl_texture != self.bound_texture:
+            if self.bindless_textures:
+                glUniformHandleui64ARB(self.texture_location, self.texture_handle(gl_texture))
+            else:
+                glBindTexture(GL_TEXTURE_2D, gl_texture)
+            self.bound_texture = gl_texture
+
+    def texture_handle(self, gl_texture):
+        """Return the resident bindless handle of a texture, creating it on first use.
+
+        Handles are only taken once the texture is fully uploaded, since its parameters are frozen afterwards.
+        """
+        handle = self.texture_handles.get(gl_texture)
+        if handle is None:
+            handle = glGetTextureHandleARB(gl_texture)
+            glMakeTextureHandleResidentARB(handle)
+            self.texture_handles[gl_texture] = handle
+        return handle
+
+    def build_draw_order(self):
+        """Flatten the visible parts into (part_id, texture, count, index type, index byte offset, base vertex)
+        tuples sorted by texture, and group them into batches that share a texture and index type."""
+        visible_parts = [
+            part_id for part_id in range(len(self.meshes))
+            if part_id in self.base_vertices and self.part_visibility.get(part_id, True)
+        ]
+        if self.point_cloud_mode:
+            # Draw the decimated point sets instead of the full triangle meshes
+            self.draw_order = [
+                (
+                    part_id,
+                    self.part_texture_gl_id.get(part_id),
+                    self.point_cloud_counts[part_id],
+                    GL_UNSIGNED_INT,
+                    self.point_cloud_offsets[part_id],
+                    self.base_vertices[part_id]
+                )
+                for part_id in visible_parts if part_id in self.point_cloud_offsets
+            ]
         else:
-            # Fallback to drawing arrays if index buffer isn't available
-            glDrawArrays(GL_TRIANGLES, 0, self.num_faces.get(part_id, 0) * 3)
+            self.draw_order = [
+                (
+                    part_id,
+                    self.part_texture_gl_id.get(part_id),
+                    self.num_faces.get(part_id, 0) * 3,
+                    self.index_types.get(part_id) if part_id in self.index_offsets else None,
+                    self.index_offsets.get(part_id, 0),
+                    self.base_vertices[part_id]
+                )
+                for part_id in visible_parts
+            ]
+        
+        # Parts sharing a texture and index type become one multi-draw call
+        self.draw_order.sort(key=lambda entry: (entry[1] is None, entry[1] or 0, entry[3] is None, entry[3] or 0))
+        self.draw_batches = []
+        for index, entry in enumerate(self.draw_order):
+            if self.draw_batches and self.draw_batches[-1][2:] == (entry[1], entry[3]):
+                start = self.draw_batches[-1][0]
+                self.draw_batches[-1] = (start, index + 1, entry[1], entry[3])
+            else:
+                self.draw_batches.append((index, index + 1, entry[1], entry[3]))
+        self.draw_counts = np.array([entry[2] for entry in self.draw_order], dtype=np.int32)
+        self.draw_index_offsets = np.array([entry[4] for entry in self.draw_order], dtype=np.intp)
+        self.draw_base_vertices = np.array([entry[5] for entry in self.draw_order], dtype=np.int32)
+        
+        # Parts without bounds (no vertices) get an empty box at the origin
+        empty = (np.zeros(3, dtype=np.float32), np.zeros(3, dtype=np.float32))
+        bounds = [self.part_bounds.get(entry[0], empty) for entry in self.draw_order]
+        self.draw_bounds = (
+            np.array([bound[0] for bound in bounds], dtype=np.float32).reshape(-1, 3),
+            np.array([bound[1] for bound in bounds], dtype=np.float32).reshape(-1, 3)
+        )
+        self.draw_order_dirty = False
 
-        # Disable arrays
-        glDisableClientState(GL_VERTEX_ARRAY)
-        if part_id in self.normal_vbos and self.normal_vbos[part_id] is not None:
-            glDisableClientState(GL_NORMAL_ARRAY)
-        if part_id in self.uv_vbos and self.uv_vbos[part_id] is not None and texture_id is not None:
-            glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+    def set_part_visible(self, part_id, visible):
+        """Show or hide a part and schedule a repaint if its visibility changed."""
+        if self.part_visibility.get(part_id, True) == visible:
+            return
+        self.part_visibility[part_id] = visible
+        self.draw_order_dirty = True
+        self.update()
+
+    def upload_mesh_buffers(self):
+        """Pack every loaded part into one shared vertex buffer and one shared index buffer behind a single VAO."""
+        part_ids = [part_id for part_id in range(len(self.meshes)) if part_id in self.vertex_data]
+        if not part_ids:
+            return
 
-        # Unbind VBOs safely
+        vertex_arrays = []
+        index_chunks = []
+        base_vertex = 0
+        index_offset = 0
+        # Already normalized models (see scale_model) are quantized as-is, without a transformed copy
+        identity_fit = self.model_scale == 1.0 and not self.model_offset.any()
+        for part_id in part_ids:
+            # Fit to the view before quantizing so float16 keeps its precision around the origin
+            positions = self.position_data[part_id]
+            if identity_fit:
+                self.vertex_data[part_id]['position'] = positions
+            else:
+                self.vertex_data[part_id]['position'] = positions * np.float32(self.model_scale) - self.model_offset
+            vertex_arrays.append(self.vertex_data[part_id])
+            self.base_vertices[part_id] = base_vertex
+            base_vertex += len(self.vertex_data[part_id])
+            for indices, offsets in ((self.index_data.get(part_id), self.index_offsets),
+                                     (self.point_cloud_data.get(part_id), self.point_cloud_offsets)):
+                if indices is None:
+                    continue
+                offsets[part_id] = index_offset
+                chunk = indices.view(np.uint8)
+                index_chunks.append(chunk)
+                # Pad to 4 bytes so 32-bit indices stay aligned after an odd count of 16-bit ones
+                padding = -len(chunk) % 4
+                if padding:
+                    index_chunks.append(np.zeros(padding, dtype=np.uint8))
+                index_offset += len(chunk) + padding
+
+        vertices = np.concatenate(vertex_arrays)
+        del vertex_arrays
+        self.vertex_data.clear()
+
+        self.vertex_buffer = self.upload_buffer(GL_ARRAY_BUFFER, vertices)
+        if index_chunks:
+            self.index_buffer = self.upload_buffer(GL_ELEMENT_ARRAY_BUFFER, np.concatenate(index_chunks))
+        self.mesh_vao = self.create_vao(self.vertex_buffer, self.index_buffer)
+        print(f"Uploaded {len(part_ids)} parts into shared buffers: {len(vertices)} vertices, {index_offset} index bytes")
+
+    def create_vao(self, vertex_buffer, index_buffer):
+        """Record an interleaved vertex buffer's attribute pointers and an optional index buffer in a new VAO."""
+        vao = glGenVertexArrays(1)
+        glBindVertexArray(vao)
+
+        stride = VERTEX_DTYPE.itemsize
+        glBindBuffer(GL_ARRAY_BUFFER, vertex_buffer)
+        glEnableVertexAttribArray(POSITION_ATTRIB)
+        glVertexAttribPointer(POSITION_ATTRIB, 3, GL_HALF_FLOAT, GL_FALSE, stride, ctypes.c_void_p(VERTEX_DTYPE.fields['position'][1]))
+        glEnableVertexAttribArray(NORMAL_ATTRIB)
+        glVertexAttribPointer(NORMAL_ATTRIB, 3, GL_SHORT, GL_TRUE, stride, ctypes.c_void_p(VERTEX_DTYPE.fields['normal'][1]))
+        glEnableVertexAttribArray(UV_ATTRIB)
+        glVertexAttribPointer(UV_ATTRIB, 2, GL_FLOAT, GL_FALSE, stride, ctypes.c_void_p(VERTEX_DTYPE.fields['uv'][1]))
+
+        if index_buffer is not None:
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, index_buffer)
+
+        glBindVertexArray(0)
         glBindBuffer(GL_ARRAY_BUFFER, 0)
-        glDisable(GL_TEXTURE_2D)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        return vao
+
+    def upload_buffer(self, target, data):
+        """Fill a GL buffer with a single call, reusing the previous model's buffer when it is large enough.
+
+        Uses immutable storage when GL_ARB_buffer_storage is available; it is only
+        rewritten wholesale by the next model load, via glBufferSubData.
+        """
+        buffer_id = self.buffer_pool.pop(target, None)
+        if buffer_id is not None and self.buffer_capacities.get(buffer_id, 0) >= data.nbytes:
+            glBindBuffer(target, buffer_id)
+            glBufferSubData(target, 0, data.nbytes, data)
+            glBindBuffer(target, 0)
+            return buffer_id
+        if buffer_id is not None:
+            self.delete_buffer(buffer_id)
+
+        buffer_id = glGenBuffers(1)
+        glBindBuffer(target, buffer_id)
+        if 'GL_ARB_buffer_storage' in self.gl_extensions and data.nbytes:
+            glBufferStorage(target, data.nbytes, data, GL_DYNAMIC_STORAGE_BIT)
+        else:
+            glBufferData(target, data.nbytes, data, GL_STATIC_DRAW)
+        glBindBuffer(target, 0)
+        self.buffer_capacities[buffer_id] = data.nbytes
+        return buffer_id
+
+    def recycle_buffer(self, target, buffer_id):
+        """Keep a buffer of the model being cleared for the next upload_buffer call on the same target."""
+        previous = self.buffer_pool.get(target)
+        if previous is not None:
+            self.delete_buffer(previous)
+        self.buffer_pool[target] = buffer_id
+
+    def delete_buffer(self, buffer_id):
+        """Delete a GL buffer and forget its capacity."""
+        glDeleteBuffers(1, [buffer_id])
+        self.buffer_capacities.pop(buffer_id, None)
 
     def load_model(self, path):
         """Load model with proper clearing and visibility handling."""
@@ -152,7 +632,8 @@ class ModelViewer(QOpenGLWidget):
             # Store original visibility and check if it's the same model
             original_visibility = {int(k): v for k, v in self.part_visibility.items()}
             is_same_model = path == self.model_path
-            print(f"Original part_visibility before clearing: {self.part_visibility}, is_same_model: {is_same_model}")
+            if VERBOSE:
+                print(f"Original part_visibility before clearing: {self.part_visibility}, is_same_model: {is_same_model}")
 
             # Clear old model data
             print("Clearing old model data...")
@@ -169,9 +650,11 @@ class ModelViewer(QOpenGLWidget):
                 return
 
             # Apply visibility settings after loading
-            print(f"Before apply_visibility_settings, part_visibility: {self.part_visibility}")
+            if VERBOSE:
+                print(f"Before apply_visibility_settings, part_visibility: {self.part_visibility}")
             self.apply_visibility_settings(original_visibility, is_same_model)
-            print(f"After apply_visibility_settings, part_visibility: {self.part_visibility}")
+            if VERBOSE:
+                print(f"After apply_visibility_settings, part_visibility: {self.part_visibility}")
             self.update()
         except Exception as e:
             import traceback
@@ -185,7 +668,9 @@ class ModelViewer(QOpenGLWidget):
             gltf = GLTF2().load(path)
             model_dir = os.path.dirname(path)
             print(f"Loading GLTF/GLB model: {path}")
-            self.load_gltf_textures(gltf, path, model_dir)
+            # Fetch the binary buffer once and share it between textures and every primitive
+            binary_data = self.load_gltf_buffer(gltf, model_dir)
+            self.load_gltf_textures(gltf, path, model_dir, binary_data)
             
             if not hasattr(gltf, 'meshes') or not gltf.meshes:
                 print("No meshes found in GLTF/GLB file")
@@ -197,6 +682,7 @@ class ModelViewer(QOpenGLWidget):
                     material_idx = getattr(primitive, 'material', None)
                     if material_idx is not None:
                         self.material_map[part_id] = material_idx
+                        self.part_texture_gl_id[part_id] = self.material_texture_ids.get(material_idx)
                     
                     mesh_data = {
                         'primitive': primitive,
@@ -211,18 +697,66 @@ class ModelViewer(QOpenGLWidget):
                     if part_id not in self.part_visibility:
                         self.part_visibility[part_id] = True
                     
-                    self.process_primitive_to_vbo(part_id, gltf, primitive)
-                    print(f"Loaded mesh part {part_id} named '{mesh_name}' with material {material_idx}")
+                    if not self.process_primitive_to_vbo(part_id, gltf, primitive, binary_data):
+                        # No immediate-mode fallback: parts without buffer data are simply never drawn
+                        print(f"Skipping mesh part {part_id} named '{mesh_name}': no vertex data")
+                        continue
+                    if VERBOSE:
+                        print(f"Loaded mesh part {part_id} named '{mesh_name}' with material {material_idx}")
             
             if self.meshes:
                 self.scale_model()
+                self.upload_mesh_buffers()
                 self.load_animations(gltf)
         except Exception as e:
             import traceback
             print(f"Error loading GLTF model: {e}")
             print(traceback.format_exc())
+        finally:
+            # The GL buffers hold the final vertex data; drop the CPU copies and the source buffer
+            self.vertex_data.clear()
+            self.position_data.clear()
+            self.index_data.clear()
+            self.point_cloud_data.clear()
+            self.accessor_cache.clear()
+            self.release_gltf_buffer()
+
+    def load_gltf_buffer(self, gltf, model_dir):
+        """Return the bytes of the model's first buffer (embedded GLB blob or external .bin file)."""
+        if not gltf.buffers:
+            print("GLTF/GLB file has no buffers")
+            return None
+        
+        if gltf.buffers[0].uri is None:
+            # GLB case: binary data is embedded
+            binary_data = gltf.binary_blob()
+            if binary_data is None:
+                print("Expected binary blob for GLB file, but none found")
+            return binary_data
+        
+        # GLTF case: load external buffer file
+        buffer_uri = urllib.parse.unquote(gltf.buffers[0].uri)
+        buffer_path = os.path.join(urllib.parse.unquote(model_dir), buffer_uri)
+        if not os.path.exists(buffer_path):
+            print(f"External buffer file not found: {buffer_path}")
+            return None
+        if os.path.getsize(buffer_path) == 0:
+            return b""
+        # Memory-map the buffer: accessors and images slice it without reading the whole file into RAM
+        with open(buffer_path, 'rb') as f:
+            self.buffer_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.buffer_mmap
 
-    def process_primitive_to_vbo(self, part_id, gltf, primitive):
+    def release_gltf_buffer(self):
+        """Unmap the external buffer file once its data has been copied into VBOs and textures."""
+        if self.buffer_mmap is not None:
+            try:
+                self.buffer_mmap.close()
+            except BufferError as e:
+                print(f"Could not unmap buffer file yet: {e}")
+            self.buffer_mmap = None
+
+    def process_primitive_to_vbo(self, part_id, gltf, primitive, binary_data):
         """Process a GLTF primitive directly to VBOs without using trimesh."""
         try:
             # Check if the primitive has position attribute (required)
@@ -230,77 +764,84 @@ class ModelViewer(QOpenGLWidget):
                 print(f"Primitive {part_id} has no POSITION attribute")
                 return False
             
-            binary_data = None
-            if gltf.buffers[0].uri is None:
-                # GLB case: binary data is embedded
-                binary_data = gltf.binary_blob()
-                if binary_data is None:
-                    print("Expected binary blob for GLB file, but none found")
-                    return False
-            else:
-                # GLTF case: load external buffer file
-                decoded_path = urllib.parse.unquote(self.model_path)
-                model_dir = os.path.dirname(decoded_path)
-                buffer_uri = gltf.buffers[0].uri
-                buffer_uri = urllib.parse.unquote(buffer_uri)
-                buffer_path = os.path.join(model_dir, buffer_uri)
-                if not os.path.exists(buffer_path):
-                    print(f"External buffer file not found: {buffer_path}")
-                    return False
-                with open(buffer_path, 'rb') as f:
-                    binary_data = f.read()
+            if binary_data is None:
+                print(f"No buffer data available for part {part_id}")
+                return False
             
             # Extract vertex positions
             pos_accessor = gltf.accessors[primitive.attributes.POSITION]
-            vertices = self._extract_accessor_data(gltf, pos_accessor, binary_data, 3)
+            vertices = self.get_accessor_data(gltf, primitive.attributes.POSITION, binary_data, 3)
             if vertices is None:
                 print(f"Failed to extract vertex positions for part {part_id}")
                 return False
             
-            # Create vertex VBO
-            self.vertex_vbos[part_id] = vbo.VBO(np.array(vertices, dtype=np.float32))
-            
             # Extract normals (optional)
+            normals = None
             if hasattr(primitive.attributes, 'NORMAL') and primitive.attributes.NORMAL is not None:
-                norm_accessor = gltf.accessors[primitive.attributes.NORMAL]
-                normals = self._extract_accessor_data(gltf, norm_accessor, binary_data, 3)
-                if normals is not None:
-                    self.normal_vbos[part_id] = vbo.VBO(np.array(normals, dtype=np.float32))
-                else:
-                    self.normal_vbos[part_id] = None
-            else:
-                self.normal_vbos[part_id] = None
+                normals = self.get_accessor_data(gltf, primitive.attributes.NORMAL, binary_data, 3)
             
             # Extract texture coordinates (optional)
+            uvs = None
             if hasattr(primitive.attributes, 'TEXCOORD_0') and primitive.attributes.TEXCOORD_0 is not None:
-                uv_accessor = gltf.accessors[primitive.attributes.TEXCOORD_0]
-                uvs = self._extract_accessor_data(gltf, uv_accessor, binary_data, 2)
-                if uvs is not None:
-                    # Flip Y coordinates for OpenGL
-                    uvs_copy = uvs.copy()
-                    uvs_copy[:, 1] = 1.0 - uvs_copy[:, 1]
-                    self.uv_vbos[part_id] = vbo.VBO(np.array(uvs_copy, dtype=np.float32))
-                else:
-                    self.uv_vbos[part_id] = None
-            else:
-                self.uv_vbos[part_id] = None
+                uvs = self.get_accessor_data(gltf, primitive.attributes.TEXCOORD_0, binary_data, 2)
+            
+            # Interleave position/normal/UV into a single VBO (missing attributes stay zero)
+            vertex_count = len(vertices)
+            interleaved = np.zeros(vertex_count, dtype=VERTEX_DTYPE)
+            # Positions stay float32 until scale_model has fitted the model; upload_mesh_buffers quantizes them
+            positions = np.array(vertices, dtype=np.float32)
+            if normals is not None:
+                # Quantize normals to SNORM16; the attribute is declared normalized so GL rescales it.
+                # Round and clamp in one float32 scratch array instead of a temporary per step
+                quantized = np.multiply(normals, np.float32(32767.0), dtype=np.float32)
+                np.rint(quantized, out=quantized)
+                np.clip(quantized, -32768, 32767, out=quantized)
+                interleaved['normal'] = quantized
+            if uvs is not None:
+                interleaved['uv'] = uvs
+                # Flip Y coordinates for OpenGL in place
+                np.subtract(1.0, interleaved['uv'][:, 1], out=interleaved['uv'][:, 1])
+            # The per-attribute arrays are no longer needed once interleaved
+            del vertices, normals, uvs
+            
+            # Decimated point set for point cloud mode: every Nth vertex along a Morton curve
+            point_indices = None
+            if vertex_count:
+                point_indices = morton_order(positions)[::POINT_CLOUD_STRIDE].astype(np.uint32)
             
             # Extract indices (optional)
+            index_data = None
+            num_faces = vertex_count // 3  # Without indices, vertices are already arranged as triangles
             if primitive.indices is not None:
-                idx_accessor = gltf.accessors[primitive.indices]
-                indices = self._extract_accessor_data(gltf, idx_accessor, binary_data, 1)
+                indices = self.get_accessor_data(gltf, primitive.indices, binary_data, 1)
                 if indices is not None:
-                    self.index_buffers[part_id] = np.array(indices, dtype=np.uint32).flatten()
-                    self.num_faces[part_id] = len(indices) // 3
-                else:
-                    self.index_buffers[part_id] = None
-                    self.num_faces[part_id] = len(vertices) // 3
-            else:
-                # No indices, assume vertices are already arranged as triangles
-                self.index_buffers[part_id] = None
-                self.num_faces[part_id] = len(vertices) // 3
+                    # Indices are packed into the shared element buffer, 16-bit when every vertex is addressable
+                    index_dtype = np.uint16 if vertex_count < 65536 else np.uint32
+                    index_data = np.ascontiguousarray(indices, dtype=index_dtype).ravel()
+                    num_faces = len(indices) // 3
+                    del indices
             
-            print(f"Created VBOs for part {part_id}: vertices={len(vertices)}, faces={self.num_faces[part_id]}")
+            # Store the part only once every array is built, so a failure above leaves nothing
+            # behind for upload_mesh_buffers to pack and draw
+            self.vertex_data[part_id] = interleaved
+            self.position_data[part_id] = positions
+            if point_indices is not None:
+                self.point_cloud_data[part_id] = point_indices
+                self.point_cloud_counts[part_id] = len(point_indices)
+            if index_data is not None:
+                self.index_types[part_id] = GL_UNSIGNED_SHORT if index_data.dtype == np.uint16 else GL_UNSIGNED_INT
+                self.index_data[part_id] = index_data
+            self.num_faces[part_id] = num_faces
+            # glTF requires min/max on POSITION accessors; trust them for float data so
+            # scale_model can skip the per-vertex min/max reduction for this part
+            if pos_accessor.componentType == 5126 and pos_accessor.min and pos_accessor.max and vertex_count:
+                self.part_bounds[part_id] = (
+                    np.array(pos_accessor.min[:3], dtype=np.float32),
+                    np.array(pos_accessor.max[:3], dtype=np.float32)
+                )
+            
+            if VERBOSE:
+                print(f"Prepared mesh data for part {part_id}: vertices={vertex_count}, faces={num_faces}")
             return True
         except Exception as e:
             import traceback
@@ -308,6 +849,19 @@ class ModelViewer(QOpenGLWidget):
             print(traceback.format_exc())
             return False
 
+    def get_accessor_data(self, gltf, accessor_index, binary_data, expected_components):
+        """Return an accessor's data, decoding each accessor only once per model load.
+
+        Primitives often share accessors (e.g. one POSITION accessor with several index sets).
+        Callers must not modify the returned array.
+        """
+        key = (accessor_index, expected_components)
+        if key not in self.accessor_cache:
+            self.accessor_cache[key] = self._extract_accessor_data(
+                gltf, gltf.accessors[accessor_index], binary_data, expected_components
+            )
+        return self.accessor_cache[key]
+
     def _extract_accessor_data(self, gltf, accessor, binary_data, expected_components):
         """Helper method to extract data from a GLTF accessor with proper error handling."""
         try:
@@ -326,32 +880,25 @@ class ModelViewer(QOpenGLWidget):
             # Determine data type and size based on component type
             component_size = 0
             dtype = None
-            format_char = ''
             
             if component_type == 5120:  # BYTE
                 dtype = np.int8
                 component_size = 1
-                format_char = 'b'
             elif component_type == 5121:  # UNSIGNED_BYTE
                 dtype = np.uint8
                 component_size = 1
-                format_char = 'B'
             elif component_type == 5122:  # SHORT
                 dtype = np.int16
                 component_size = 2
-                format_char = 'h'
             elif component_type == 5123:  # UNSIGNED_SHORT
                 dtype = np.uint16
                 component_size = 2
-                format_char = 'H'
             elif component_type == 5125:  # UNSIGNED_INT
                 dtype = np.uint32
                 component_size = 4
-                format_char = 'I'
             elif component_type == 5126:  # FLOAT
                 dtype = np.float32
                 component_size = 4
-                format_char = 'f'
             else:
                 print(f"Unsupported component type: {component_type}")
                 return None
@@ -363,62 +910,36 @@ class ModelViewer(QOpenGLWidget):
             if byte_stride == 0:
                 byte_stride = element_size
             
-            # More efficient data extraction
             if byte_stride == element_size:
-                # If data is tightly packed, we can extract it in one go
-                start = byte_offset
-                end = start + accessor.count * element_size
-                buffer_data = binary_data[start:end]
-                
-                # If we need to convert from BYTE or SHORT to normalized float
-                if accessor.normalized and component_type in [5120, 5121, 5122, 5123]:
-                    # Convert to numpy array first
-                    array = np.frombuffer(buffer_data, dtype=dtype).reshape(-1, expected_components)
-                    
-                    # Normalize based on component type
-                    if component_type == 5120:  # BYTE: -127 to 127
-                        array = array.astype(np.float32) / 127.0
-                    elif component_type == 5121:  # UNSIGNED_BYTE: 0 to 255
-                        array = array.astype(np.float32) / 255.0
-                    elif component_type == 5122:  # SHORT: -32767 to 32767
-                        array = array.astype(np.float32) / 32767.0
-                    elif component_type == 5123:  # UNSIGNED_SHORT: 0 to 65535
-                        array = array.astype(np.float32) / 65535.0
-                    
-                    return array
-                else:
-                    # Regular conversion to numpy array
-                    return np.frombuffer(buffer_data, dtype=dtype).reshape(-1, expected_components)
+                # If data is tightly packed, view it in place; slicing the buffer first would copy it
+                count = min(accessor.count, max(len(binary_data) - byte_offset, 0) // element_size)
+                array = np.frombuffer(
+                    binary_data, dtype=dtype, count=count * expected_components, offset=byte_offset
+                ).reshape(-1, expected_components)
             else:
-                # If data has stride, extract elements one by one
-                data = []
-                for i in range(accessor.count):
-                    start = byte_offset + i * byte_stride
-                    end = start + element_size
-                    element_data = binary_data[start:end]
-                    if len(element_data) < element_size:
-                        print(f"Warning: Data truncated at element {i}, got {len(element_data)} bytes, expected {element_size}")
-                        break
-                    
-                    # Unpack the element data
-                    values = struct.unpack(f'{expected_components}{format_char}', element_data)
-                    data.append(values)
-                
-                # Convert to numpy array
-                array = np.array(data, dtype=dtype)
-                
-                # Apply normalization if needed
-                if accessor.normalized and component_type in [5120, 5121, 5122, 5123]:
-                    if component_type == 5120:  # BYTE
-                        array = array.astype(np.float32) / 127.0
-                    elif component_type == 5121:  # UNSIGNED_BYTE
-                        array = array.astype(np.float32) / 255.0
-                    elif component_type == 5122:  # SHORT
-                        array = array.astype(np.float32) / 32767.0
-                    elif component_type == 5123:  # UNSIGNED_SHORT
-                        array = array.astype(np.float32) / 65535.0
-                
-                return array
+                # Interleaved data: view every element in place using the buffer view's stride.
+                # Callers copy the view exactly once, into the interleaved vertex array or the index buffer.
+                count = accessor.count
+                available = (len(binary_data) - byte_offset - element_size) // byte_stride + 1
+                if available < count:
+                    print(f"Warning: Data truncated at element {max(available, 0)}, expected {count} elements")
+                    count = max(available, 0)
+                array = np.ndarray(
+                    shape=(count, expected_components),
+                    dtype=dtype,
+                    buffer=binary_data,
+                    offset=byte_offset,
+                    strides=(byte_stride, component_size)
+                )
+            
+            # Convert BYTE/SHORT data to normalized floats
+            if accessor.normalized and component_type in NORMALIZED_DIVISORS:
+                # Single pass: multiply straight into a float32 output instead of astype + divide
+                normalized = np.empty(array.shape, dtype=np.float32)
+                np.multiply(array, np.float32(1.0 / NORMALIZED_DIVISORS[component_type]), out=normalized)
+                array = normalized
+            
+            return array
             
         except Exception as e:
             import traceback
@@ -429,28 +950,50 @@ class ModelViewer(QOpenGLWidget):
     def clear_model_data(self):
         """Clear all model data."""
         self.meshes.clear()
-        for tex_id in self.texture_ids.values():
+        for handle in self.texture_handles.values():
+            glMakeTextureHandleNonResidentARB(handle)
+        self.texture_handles.clear()
+        # Images with identical content share one texture, so delete each id once
+        for tex_id in set(self.texture_ids.values()):
             if tex_id:
                 glDeleteTextures([tex_id])
         self.texture_ids.clear()
+        self.texture_storage.clear()
         self.material_map.clear()
-        for vbo in self.vertex_vbos.values():
-            if vbo is not None:
-                vbo.delete()
-        self.vertex_vbos.clear()
-        for vbo in self.uv_vbos.values():
-            if vbo is not None:
-                vbo.delete()
-        self.uv_vbos.clear()
-        for vbo in self.normal_vbos.values():
-            if vbo is not None:
-                vbo.delete()
-        self.normal_vbos.clear()
-        self.index_buffers.clear()
+        self.material_texture_ids.clear()
+        self.part_texture_gl_id.clear()
+        self.model_scale = 1.0
+        self.model_offset = np.zeros(3, dtype=np.float32)
+        self.view_dirty = True
+        # Keep the shared buffers for the next model instead of reallocating GPU memory on every swap
+        for target, buffer_id in ((GL_ARRAY_BUFFER, self.vertex_buffer), (GL_ELEMENT_ARRAY_BUFFER, self.index_buffer)):
+            if buffer_id is not None:
+                self.recycle_buffer(target, buffer_id)
+        self.vertex_buffer = None
+        self.index_buffer = None
+        if self.mesh_vao is not None:
+            glDeleteVertexArrays(1, [self.mesh_vao])
+        self.mesh_vao = None
+        self.vertex_data.clear()
+        self.position_data.clear()
+        self.index_data.clear()
+        self.point_cloud_data.clear()
+        self.accessor_cache.clear()
+        self.index_types.clear()
+        self.base_vertices.clear()
+        self.index_offsets.clear()
+        self.point_cloud_offsets.clear()
+        self.point_cloud_counts.clear()
+        self.part_bounds.clear()
+        self.part_centroids.clear()
+        self.draw_order = []
+        self.draw_order_dirty = True
+        self.release_gltf_buffer()
         self.num_faces.clear()
         self.part_names.clear()
         # Don't clear part_visibility - it will be handled by apply_visibility_settings
-        print(f"After clear_model_data, part_visibility: {self.part_visibility}")
+        if VERBOSE:
+            print(f"After clear_model_data, part_visibility: {self.part_visibility}")
 
     def apply_visibility_settings(self, original_visibility, is_same_model):
         """Apply visibility settings based on whether it's the same model or a new one."""
@@ -463,10 +1006,12 @@ class ModelViewer(QOpenGLWidget):
             for part_id in current_parts:
                 if part_id in original_visibility:
                     new_visibility[part_id] = original_visibility[part_id]
-                    print(f"Preserved visibility for part {part_id} (same model): {new_visibility[part_id]}")
+                    if VERBOSE:
+                        print(f"Preserved visibility for part {part_id} (same model): {new_visibility[part_id]}")
                 else:
                     new_visibility[part_id] = True
-                    print(f"Set default visibility for new part {part_id} (same model): True")
+                    if VERBOSE:
+                        print(f"Set default visibility for new part {part_id} (same model): True")
             self.part_visibility = new_visibility
         else:
             # New model: reset visibility and apply config settings or defaults
@@ -474,15 +1019,20 @@ class ModelViewer(QOpenGLWidget):
             for part_id in current_parts:
                 if part_id in original_visibility:
                     self.part_visibility[part_id] = original_visibility[part_id]
-                    print(f"Applied config visibility for part {part_id} (new model): {self.part_visibility[part_id]}")
+                    if VERBOSE:
+                        print(f"Applied config visibility for part {part_id} (new model): {self.part_visibility[part_id]}")
                 else:
                     self.part_visibility[part_id] = True
-                    print(f"Set default visibility for part {part_id} (new model): True")
+                    if VERBOSE:
+                        print(f"Set default visibility for part {part_id} (new model): True")
+        
+        self.draw_order_dirty = True
         
         # Log final state
-        print(f"Final part_visibility after applying settings: {self.part_visibility}")
+        if VERBOSE:
+            print(f"Final part_visibility after applying settings: {self.part_visibility}")
 
-    def load_gltf_textures(self, gltf, path, model_dir):
+    def load_gltf_textures(self, gltf, path, model_dir, binary_data):
         """Improved method to load textures from GLTF/GLB files."""
         try:
             print(f"Loading textures from: {path}")
@@ -497,10 +1047,12 @@ class ModelViewer(QOpenGLWidget):
                 for texture_idx, texture in enumerate(gltf.textures):
                     if hasattr(texture, 'source') and texture.source is not None:
                         texture_to_image[texture_idx] = texture.source
-                        print(f"Texture {texture_idx} uses image {texture.source}")
+                        if VERBOSE:
+                            print(f"Texture {texture_idx} uses image {texture.source}")
 
             # Create a mapping from material index to texture indices
             material_to_textures = {}
+            material_base_texture = {}
             if hasattr(gltf, 'materials') and gltf.materials:
                 for material_idx, material in enumerate(gltf.materials):
                     material_to_textures[material_idx] = set()
@@ -514,7 +1066,9 @@ class ModelViewer(QOpenGLWidget):
                             if hasattr(pbr.baseColorTexture, 'index'):
                                 texture_idx = pbr.baseColorTexture.index
                                 material_to_textures[material_idx].add(texture_idx)
-                                print(f"Material {material_idx} uses texture {texture_idx} for baseColor")
+                                material_base_texture[material_idx] = texture_idx
+                                if VERBOSE:
+                                    print(f"Material {material_idx} uses texture {texture_idx} for baseColor")
 
                     # Other texture types (normal, emissive, etc.)
                     for texture_type in ['normalTexture', 'emissiveTexture', 'occlusionTexture']:
@@ -523,9 +1077,12 @@ class ModelViewer(QOpenGLWidget):
                             if hasattr(texture_ref, 'index'):
                                 texture_idx = texture_ref.index
                                 material_to_textures[material_idx].add(texture_idx)
-                                print(f"Material {material_idx} uses texture {texture_idx} for {texture_type}")
+                                if VERBOSE:
+                                    print(f"Material {material_idx} uses texture {texture_idx} for {texture_type}")
 
-            # Process external image files first
+            # Collect every image to decode, whether an external file or embedded in a GLB.
+            # Images sharing a file or identical bytes are keyed together and decoded/uploaded once
+            pending_images = {}
             if hasattr(gltf, 'images') and gltf.images:
                 for image_idx, image in enumerate(gltf.images):
                     # Skip data URIs for now
@@ -535,57 +1092,66 @@ class ModelViewer(QOpenGLWidget):
 
                         if os.path.exists(image_path):
                             print(f"Loading external texture: {image_path}")
-                            texture_id = self.load_texture(image_path)
+                            key = ('file', os.path.realpath(image_path))
+                            pending_images.setdefault(key, (image_path, image_path, True, []))[3].append(image_idx)
+
+                    # Handle embedded image in GLB
+                    elif is_glb and binary_data is not None and hasattr(image, 'bufferView') and image.bufferView is not None:
+                        buffer_view = gltf.bufferViews[image.bufferView]
+                        buffer_offset = buffer_view.byteOffset or 0
+                        buffer_length = buffer_view.byteLength
+
+                        # Extract the image data
+                        image_data = binary_data[buffer_offset:buffer_offset + buffer_length]
+                        if image_data:
+                            key = ('data', hashlib.blake2b(image_data, digest_size=16).digest())
+                            description = f"buffer view {image.bufferView}"
+                            pending_images.setdefault(key, (description, io.BytesIO(image_data), False, []))[3].append(image_idx)
+
+            # Decode every image in parallel (PIL's decoders release the GIL); GL uploads stay on this
+            # thread and happen as soon as each image is ready, overlapping the remaining decodes
+            if pending_images:
+                workers = min(len(pending_images), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(decode_texture, source, self.max_texture_size, flip, True): (image_indices, description)
+                        for description, source, flip, image_indices in pending_images.values()
+                    }
+                    for future in as_completed(futures):
+                        # Pop the finished future (and drop the levels after upload) so each decoded
+                        # mipmap chain is freed once it is on the GPU instead of living until the pool exits
+                        image_indices, description = futures.pop(future)
+                        try:
+                            levels, width, height = future.result()
+                            del future
+                            if VERBOSE:
+                                print(f"Successfully decoded images {image_indices} from {description}")
+
+                            # Create OpenGL texture from the mipmap chain built by the worker
+                            texture_id = self.create_texture_from_bytes(levels[0], width, height, levels[1:])
+                            del levels
                             if texture_id:
-                                self.texture_ids[image_idx] = texture_id
-                                print(f"Loaded external texture {image_idx} with OpenGL ID {texture_id}")
-
-            # Handle embedded images in GLB
-            if is_glb and hasattr(gltf, 'images') and gltf.images:
-                binary_blob = gltf.binary_blob()
-                if binary_blob is not None:
-                    for image_idx, image in enumerate(gltf.images):
-                        # Skip images we've already handled
-                        if image_idx in self.texture_ids:
-                            continue
-                        
-                        # Handle embedded image in GLB
-                        if hasattr(image, 'bufferView') and image.bufferView is not None:
-                            buffer_view = gltf.bufferViews[image.bufferView]
-                            buffer_offset = buffer_view.byteOffset or 0
-                            buffer_length = buffer_view.byteLength
-
-                            # Extract the image data
-                            image_data = binary_blob[buffer_offset:buffer_offset + buffer_length]
-
-                            if image_data:
-                                # Get mime type
-                                mime_type = 'image/png'  # Default
-                                if hasattr(image, 'mimeType') and image.mimeType:
-                                    mime_type = image.mimeType
-
-                                # Create a PIL Image from the binary data
-                                try:
-                                    img = Image.open(io.BytesIO(image_data))
-                                    print(f"Successfully loaded embedded image {image_idx} from buffer view {image.bufferView}")
-
-                                    # Create OpenGL texture
-                                    texture_id = self.create_texture_from_image(img)
-                                    if texture_id:
-                                        self.texture_ids[image_idx] = texture_id
-                                        print(f"Created texture {image_idx} with OpenGL ID {texture_id} from embedded image")
-                                except Exception as e:
-                                    print(f"Failed to load embedded image {image_idx}: {e}")
-
-            # Map texture images to materials for rendering
+                                for image_idx in image_indices:
+                                    self.texture_ids[image_idx] = texture_id
+                                if VERBOSE:
+                                    print(f"Created texture for images {image_indices} with OpenGL ID {texture_id} from {description}")
+                        except Exception as e:
+                            print(f"Failed to load images {image_indices} from {description}: {e}")
+
+            # Resolve each material to the OpenGL texture it is drawn with
             for material_idx, texture_indices in material_to_textures.items():
-                for texture_idx in texture_indices:
-                    if texture_idx in texture_to_image:
-                        image_idx = texture_to_image[texture_idx]
-                        if image_idx in self.texture_ids:
-                            # If we have multiple textures for a material, prioritize baseColor
-                            # (This is a simplification - a proper PBR renderer would use all textures)
+                # If we have multiple textures for a material, prioritize baseColor
+                # (This is a simplification - a proper PBR renderer would use all textures)
+                candidates = sorted(texture_indices)
+                if material_idx in material_base_texture:
+                    candidates.insert(0, material_base_texture[material_idx])
+                for texture_idx in candidates:
+                    image_idx = texture_to_image.get(texture_idx)
+                    if image_idx in self.texture_ids:
+                        self.material_texture_ids[material_idx] = self.texture_ids[image_idx]
+                        if VERBOSE:
                             print(f"Material {material_idx} will use image {image_idx} with texture ID {self.texture_ids[image_idx]}")
+                        break
 
             print(f"Texture loading completed. Loaded {len(self.texture_ids)} textures.")
         except Exception as e:
@@ -603,27 +1169,17 @@ class ModelViewer(QOpenGLWidget):
                 print(f"Texture file not found: {path}")
                 return None
 
-            # Try to open the image
+            # Try to open and decode the image
             try:
-                image = Image.open(path)
+                levels, width, height = decode_texture(path, self.max_texture_size, flip=True)
             except Exception as e:
                 print(f"Failed to open image: {e}")
                 return None
 
-            # Convert to RGBA if needed
-            if image.mode != 'RGBA':
-                image = image.convert('RGBA')
-
-            image = image.transpose(Image.FLIP_TOP_BOTTOM)
-
-            # Resize large textures to improve performance
-            max_size = 1024
-            if image.width > max_size or image.height > max_size:
-                image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-
             # Create OpenGL texture
-            texture_id = self.create_texture_from_image(image)
-            print(f"Created texture ID: {texture_id}")
+            texture_id = self.create_texture_from_bytes(levels[0], width, height)
+            if VERBOSE:
+                print(f"Created texture ID: {texture_id}")
             return texture_id
         except Exception as e:
             print(f"Error loading texture {path}: {e}")
@@ -631,6 +1187,15 @@ class ModelViewer(QOpenGLWidget):
         
     def create_texture_from_image(self, image):
         """Create an OpenGL texture from a PIL Image."""
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        return self.create_texture_from_bytes(image.tobytes("raw", "BGRA"), image.width, image.height)
+
+    def create_texture_from_bytes(self, pixels, width, height, mip_levels=()):
+        """Create an OpenGL texture from tightly packed BGRA bytes (see TEXTURE_UPLOAD_FORMAT).
+
+        mip_levels optionally holds a precomputed mipmap chain (level 1 down to 1x1), as from decode_texture.
+        """
         texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, texture_id)
         
@@ -639,24 +1204,92 @@ class ModelViewer(QOpenGLWidget):
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+        if self.texture_anisotropy > 1.0:
+            glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAX_ANISOTROPY_EXT, self.texture_anisotropy)
         
-        # Convert image to bytes and upload to GPU
-        img_data = np.array(image)
-        glTexImage2D(
-            GL_TEXTURE_2D, 0, GL_RGBA, 
-            image.width, image.height, 0, 
-            GL_RGBA, GL_UNSIGNED_BYTE, img_data
-        )
+        # Let the driver store large textures DXT5-compressed (4x less VRAM and texture bandwidth)
+        internal_format = GL_RGBA8
+        if min(width, height) >= COMPRESSED_TEXTURE_MIN_SIZE and 'GL_EXT_texture_compression_s3tc' in self.gl_extensions:
+            internal_format = GL_COMPRESSED_RGBA_S3TC_DXT5_EXT
         
-        # Generate mipmaps
-        try:
-            glGenerateMipmap(GL_TEXTURE_2D)
-        except:
-            # Fallback for older OpenGL versions
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        self.upload_texture_pixels(texture_id, pixels, width, height, internal_format, mip_levels)
         
         return texture_id
 
+    def upload_texture_pixels(self, texture_id, pixels, width, height, internal_format=GL_RGBA8, mip_levels=()):
+        """(Re)fill a texture's pixels, allocating immutable storage only on the first upload.
+
+        Later uploads of the same size go through glTexSubImage2D so the driver keeps the
+        existing allocation instead of reallocating it. Without mip_levels the mipmaps are
+        generated by the driver.
+        """
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        if texture_id not in self.texture_storage:
+            if 'GL_ARB_texture_storage' in self.gl_extensions:
+                glTexStorage2D(GL_TEXTURE_2D, max(width, height).bit_length(), internal_format, width, height)
+            else:
+                # Fallback for older OpenGL versions: allocate every level without data
+                for level in range(max(width, height).bit_length()):
+                    glTexImage2D(
+                        GL_TEXTURE_2D, level, internal_format, 
+                        max(1, width >> level), max(1, height >> level), 0, 
+                        *TEXTURE_UPLOAD_FORMAT, None
+                    )
+            self.texture_storage[texture_id] = (width, height)
+        elif self.texture_storage[texture_id] != (width, height):
+            print(f"Cannot upload {width}x{height} pixels into texture {texture_id} of size {self.texture_storage[texture_id]}")
+            return
+        
+        # Stage the pixels in a pixel buffer so the driver can DMA them asynchronously
+        for level, level_pixels in enumerate([pixels, *mip_levels]):
+            level_width, level_height = max(1, width >> level), max(1, height >> level)
+            if not self.upload_pixels_through_buffer(level_pixels, level_width, level_height, level):
+                glTexSubImage2D(GL_TEXTURE_2D, level, 0, 0, level_width, level_height, *TEXTURE_UPLOAD_FORMAT, level_pixels)
+        
+        # Generate mipmaps unless a precomputed chain was uploaded
+        if not mip_levels:
+            if self.has_mipmap:
+                glGenerateMipmap(GL_TEXTURE_2D)
+            else:
+                # Fallback for older OpenGL versions
+                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+
+    def upload_pixels_through_buffer(self, pixels, width, height, level=0):
+        """Copy pixels into the next pixel unpack buffer of the ring and update a level of the bound texture from it.
+
+        Returns False when no buffer could be mapped so the caller can upload directly.
+        """
+        if not self.pixel_buffers:
+            self.pixel_buffers = list(glGenBuffers(PIXEL_BUFFER_COUNT))
+        pixel_buffer = self.pixel_buffers[self.pixel_buffer_index]
+        self.pixel_buffer_index = (self.pixel_buffer_index + 1) % len(self.pixel_buffers)
+
+        size = len(pixels)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, pixel_buffer)
+        try:
+            # Orphan the previous contents before the unsynchronized map, since a glTexSubImage2D
+            # still in flight may be reading them. Re-specifying at the buffer's largest size so far
+            # keeps the storage size stable across mip levels and smaller images
+            capacity = max(self.pixel_buffer_sizes.get(pixel_buffer, 0), size)
+            glBufferData(GL_PIXEL_UNPACK_BUFFER, capacity, None, GL_STREAM_DRAW)
+            self.pixel_buffer_sizes[pixel_buffer] = capacity
+            pointer = glMapBufferRange(
+                GL_PIXEL_UNPACK_BUFFER, 0, size,
+                GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT | GL_MAP_UNSYNCHRONIZED_BIT
+            )
+            if not pointer:
+                return False
+            ctypes.memmove(pointer, pixels, size)
+            glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+            # With a pixel unpack buffer bound the data argument is an offset into it
+            glTexSubImage2D(GL_TEXTURE_2D, level, 0, 0, width, height, *TEXTURE_UPLOAD_FORMAT, None)
+            return True
+        except Exception as e:
+            print(f"Pixel buffer upload failed, uploading directly: {e}")
+            return False
+        finally:
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+
     def load_animations(self, gltf):
         """Load animations from GLTF file."""
         if not hasattr(gltf, 'animations') or not gltf.animations:
@@ -676,98 +1309,104 @@ class ModelViewer(QOpenGLWidget):
         pass
     
     def scale_model(self):
-        """Scale all meshes to fit the view using VBO data."""
-        if not self.meshes or not self.vertex_vbos:
+        """Compute the scale and offset that fit all meshes to the view (baked in by upload_mesh_buffers)."""
+        if not self.meshes or not self.position_data:
             print("No meshes or vertex VBOs to scale")
             return
 
-        # Collect all vertex data from VBOs
-        all_vertices = []
+        # Reduce bounds and the vertex sum part by part instead of stacking every vertex
+        min_bounds = np.full(3, np.inf, dtype=np.float32)
+        max_bounds = np.full(3, -np.inf, dtype=np.float32)
+        centroid_sum = np.zeros(3, dtype=np.float64)
+        total = 0
         for part_id in range(len(self.meshes)):
-            if part_id in self.vertex_vbos and self.vertex_vbos[part_id] is not None:
-                vbo = self.vertex_vbos[part_id]
-                vbo.bind()
-                # Get the data from the VBO (assuming float32, 3 components per vertex)
-                vertex_data = np.frombuffer(
-                    vbo.data, dtype=np.float32
-                ).reshape(-1, 3)
-                vbo.unbind()
-                all_vertices.append(vertex_data)
-
-        if not all_vertices:
+            if part_id in self.position_data and len(self.position_data[part_id]):
+                positions = self.position_data[part_id]
+                if part_id not in self.part_bounds:
+                    self.part_bounds[part_id] = (positions.min(axis=0), positions.max(axis=0))
+                part_min, part_max = self.part_bounds[part_id]
+                np.minimum(min_bounds, part_min, out=min_bounds)
+                np.maximum(max_bounds, part_max, out=max_bounds)
+                part_sum = positions.sum(axis=0, dtype=np.float64)
+                self.part_centroids[part_id] = (part_sum / len(positions)).astype(np.float32)
+                centroid_sum += part_sum
+                total += len(positions)
+
+        if not total:
             print("No vertex data found in VBOs")
             return
 
-        # Stack all vertices to compute bounds
-        all_vertices = np.vstack(all_vertices)
-        min_bounds = np.min(all_vertices, axis=0)
-        max_bounds = np.max(all_vertices, axis=0)
-        bounds = np.vstack((min_bounds, max_bounds))
-
-        size_range = bounds[1] - bounds[0]
+        size_range = max_bounds - min_bounds
         if np.max(size_range) == 0:
             print("Model has zero size range, skipping scaling")
             return
 
         # Use a scale factor to fit the view (adjust as needed)
-        scale = 4.0 / max(size_range)
+        scale = np.float32(4.0 / max(size_range))
 
         # Calculate the centroid of all vertices
-        centroid = np.mean(all_vertices, axis=0)
+        centroid = (centroid_sum / total).astype(np.float32)
 
-        # Scale and center each part’s vertex data
-        for part_id in range(len(self.meshes)):
-            if part_id in self.vertex_vbos and self.vertex_vbos[part_id] is not None:
-                vbo = self.vertex_vbos[part_id]
-                vbo.bind()
-                # Get current vertex data
-                vertices = np.frombuffer(
-                    vbo.data, dtype=np.float32
-                ).reshape(-1, 3)
-
-                # Apply scaling and centering
-                vertices *= scale
-                vertices -= centroid * scale
-
-                # Update the VBO with new data
-                new_data = vertices.astype(np.float32).tobytes()
-                glBufferData(GL_ARRAY_BUFFER, len(new_data), new_data, GL_STATIC_DRAW)
-                vbo.unbind()
-                print(f"Scaled and updated VBO for part {part_id}: {len(vertices)} vertices")
+        if abs(scale - 1) < 1e-3 and np.linalg.norm(centroid) < 1e-3 * max(size_range):
+            # Pre-normalized assets keep an exact identity transform
+            print("Model already normalized, skipping rescale")
+            self.model_scale = 1.0
+            self.model_offset = np.zeros(3, dtype=np.float32)
+        else:
+            # Scale and center once, before the positions are quantized and uploaded
+            self.model_scale = float(scale)
+            self.model_offset = (centroid * scale).astype(np.float32)
+            print(f"Model scale {self.model_scale}, offset {self.model_offset}")
 
+        self.view_dirty = True
         self.update()
 
     def mousePressEvent(self, event):
         """Handle mouse press events for model interaction."""
-        self.last_pos = event.position()
+        position = event.position()
+        self.last_pos = (position.x(), position.y())
 
     def mouseMoveEvent(self, event):
         """Handle mouse movement events for rotation and panning."""
+        # Read the event position once and keep plain floats instead of re-querying QPointFs
+        position = event.position()
+        x, y = position.x(), position.y()
         if self.last_pos is None:
-            self.last_pos = event.position()
+            self.last_pos = (x, y)
             return
             
-        dx = event.position().x() - self.last_pos.x()
-        dy = event.position().y() - self.last_pos.y()
+        dx = x - self.last_pos[0]
+        dy = y - self.last_pos[1]
         
         if event.buttons() & Qt.MouseButton.LeftButton:
             # Left mouse: Rotate
             self.rotation_y += dx * 0.5
             self.rotation_x += dy * 0.5
-            self.update()
+            self.view_dirty = True
+            self.schedule_repaint()
         elif event.buttons() & Qt.MouseButton.MiddleButton:
             # Middle mouse: Pan
             self.translate_x += dx * 0.01
             self.translate_y -= dy * 0.01
-            self.update()
+            self.view_dirty = True
+            self.schedule_repaint()
         
-        self.last_pos = event.position()
+        self.last_pos = (x, y)
 
     def wheelEvent(self, event):
         """Add zooming capability with mouse wheel."""
         delta = event.angleDelta().y()
         self.zoom += delta * 0.01
-        self.update()
+        self.view_dirty = True
+        self.schedule_repaint()
+
+    def schedule_repaint(self):
+        """Request a repaint within one frame; events arriving before it fires share it.
+
+        The camera state is updated on every event, so no motion is lost, only redundant frames.
+        """
+        if not self.repaint_timer.isActive():
+            self.repaint_timer.start()
     
     def sizeHint(self):
         """Provide a default size for the widget."""
@@ -780,39 +1419,28 @@ class ModelViewer(QOpenGLWidget):
     def toggle_wireframe(self, enable=None):
         """Toggle wireframe rendering mode."""
         if enable is None:
-            # Toggle current state
-            if glIsEnabled(GL_POLYGON_OFFSET_FILL):
-                glDisable(GL_POLYGON_OFFSET_FILL)
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            else:
-                glEnable(GL_POLYGON_OFFSET_FILL)
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-        else:
-            # Set specified state
-            if enable:
-                glDisable(GL_POLYGON_OFFSET_FILL)
-                glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
-            else:
-                glEnable(GL_POLYGON_OFFSET_FILL)
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+            # Toggle the cached state; querying GL here would stall the pipeline
+            enable = not self.wireframe
+        if enable == self.wireframe:
+            return
+        # The GL state is applied in paintGL, where the widget's context is guaranteed to be current
+        self.wireframe = enable
+        self.polygon_mode_dirty = True
         self.update()
         
     def use_point_cloud(self, enable=None):
-        """Toggle point cloud rendering mode for very large models."""
+        """Toggle point cloud rendering mode for very large models.
+
+        Point cloud mode draws a decimated, Morton-ordered subset of each part's vertices
+        (see POINT_CLOUD_STRIDE) instead of every triangle.
+        """
         if enable is None:
             # Toggle current state
-            if glGetIntegerv(GL_POLYGON_MODE) == GL_POINT:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
-            else:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_POINT)
-                glPointSize(3.0)
-        else:
-            # Set specified state
-            if enable:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_POINT)
-                glPointSize(3.0)
-            else:
-                glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+            enable = not self.point_cloud_mode
+        if enable == self.point_cloud_mode:
+            return
+        self.point_cloud_mode = enable
+        self.draw_order_dirty = True
         self.update()
     
     def enterEvent(self, event):
@@ -2,24 +2,18 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QGraphicsView, QGraphicsScene
 from PyQt6.QtGui import QPainter, QTransform
 from PyQt6.QtMultimedia import QMediaPlayer
 from PyQt6.QtMultimediaWidgets import QGraphicsVideoItem
-from PyQt6.QtCore import QUrl, Qt, QRectF, QPointF, QTimer
+from PyQt6.QtCore import QUrl, Qt, QRectF, QPointF
 import os
 
 class VideoPlayer(QWidget):
-    def __init__(self, video_path):
+    def __init__(self, video_path=None):
         super().__init__()
         self.video_path = video_path
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
         
+        self.video_initialized = False
         self.init_ui()
         self.setup_player()
-        
-        self.check_video_timer = QTimer(self)
-        self.check_video_timer.setInterval(100)
-        self.check_video_timer.timeout.connect(self.check_video_size)
-        self.check_video_timer.start()
-        self.video_initialized = False
-        self.loop_point_reached = False
 
     def init_ui(self):
         """Initialize the video player UI"""
@@ -35,6 +29,8 @@ class VideoPlayer(QWidget):
         self.view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
         self.video_item = QGraphicsVideoItem()
+        # Initialize as soon as the first frame reports its size instead of polling for it
+        self.video_item.nativeSizeChanged.connect(self.check_video_size)
         self.scene.addItem(self.video_item)
         self.layout.addWidget(self.view)
         self.setLayout(self.layout)
@@ -44,11 +40,12 @@ class VideoPlayer(QWidget):
         self.player = QMediaPlayer()
         self.player.setVideoOutput(self.video_item)
 
-        # Load initial video
-        self.set_video(self.video_path)
+        # Load initial video (may be deferred by the caller)
+        if self.video_path:
+            self.set_video(self.video_path)
 
-        # Enable looping
-        self.player.positionChanged.connect(self.check_loop_point)
+        # Enable looping; the backend restarts playback itself, no per-frame position checks
+        self.player.setLoops(QMediaPlayer.Loops.Infinite)
 
         # Start playback
         self.player.play()
@@ -60,28 +57,19 @@ class VideoPlayer(QWidget):
             self.player.setSource(QUrl.fromLocalFile(video_path))
 
             self.video_initialized = False
-            self.loop_point_reached = False
+            # nativeSizeChanged does not fire again for a clip of the same size as the current one
+            self.check_video_size(self.video_item.nativeSize())
 
             self.player.play()
         else:
             print(f"Video file not found: {video_path}")
 
 
-    def check_loop_point(self, position):
-        """Check if we are near the end of the video and prepare to loop"""
-        duration = self.player.duration()
-        if duration > 0 and position > duration - 100: # Check if within 100 ms of the end
-            if not self.loop_point_reached:
-                self.player.setPosition(0)
-                self.loop_point_reached = True
-        elif self.loop_point_reached and position > 10: # Reset flag if playback has restarted
-            self.loop_point_reached = False
-
-    def check_video_size(self):
-        """Check if video has loaded and has a valid size"""
+    def check_video_size(self, native_size):
+        """Initialize the view once the video reports a valid native size"""
         size = self.video_item.size()
         
-        if not self.video_initialized and size.width() > 0 and size.height() > 0:
+        if not self.video_initialized and native_size.isValid() and size.width() > 0 and size.height() > 0:
             # Only initialize once we have a valid video size
             self.video_initialized = True
             self.on_video_available()
@@ -1,17 +1,41 @@
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QRect
+from functools import lru_cache
+
+_screen_size = None  # Cached (width, height) of the primary screen, see get_screen_size
+_watched_screen = None  # Screen whose geometryChanged signal invalidates the cache
+
+def _invalidate_screen_size(*args):
+    """Forget the cached screen size and every vw/vh result derived from it."""
+    global _screen_size
+    _screen_size = None
+    vh.cache_clear()
+    vw.cache_clear()
 
 def get_screen_size():
-    """Returns the screen width and height as a tuple (width, height)."""
-    screen = QApplication.primaryScreen()
-    screen_rect = screen.geometry()
-    return screen_rect.width(), screen_rect.height()
+    """Returns the screen width and height as a tuple (width, height).
+
+    The size is queried once and cached until the primary screen or its geometry changes.
+    """
+    global _screen_size, _watched_screen
+    if _screen_size is None:
+        screen = QApplication.primaryScreen()
+        screen_rect = screen.geometry()
+        _screen_size = (screen_rect.width(), screen_rect.height())
+        if _watched_screen is None:
+            QApplication.instance().primaryScreenChanged.connect(_invalidate_screen_size)
+        if screen is not _watched_screen:
+            screen.geometryChanged.connect(_invalidate_screen_size)
+            _watched_screen = screen
+    return _screen_size
 
+@lru_cache(maxsize=128)
 def vh(percent: float):
     """Convert percentage (like 10vh) into pixel height."""
     screen_height = get_screen_size()[1]
     return int(screen_height * (percent / 100))
 
+@lru_cache(maxsize=128)
 def vw(percent: float):
     """Convert percentage (like 10vw) into pixel width."""
     screen_width = get_screen_size()[0]